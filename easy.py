@@ -2,6 +2,8 @@ from typing import List, Tuple, Dict
 import math
 import time
 
+import prime_table
+
 def is_palindrome(n: int) -> bool:
     """Проверяет, является ли число палиндромом"""
     s = str(n)
@@ -10,6 +12,9 @@ def is_palindrome(n: int) -> bool:
 
 def is_prime(n: int) -> bool:
     """Проверяет, является ли число простым"""
+    table = prime_table.TABLE
+    if table is not None and n <= table.limit:
+        return table.is_prime(n)
     if n < 2:
         return False
     if n == 2:
@@ -140,6 +145,9 @@ def twin_primes_analysis(limit_pairs: int = 1000) -> Tuple[List[Tuple[int, int]]
 
     def sieve_of_eratosthenes(limit: int) -> List[bool]:
         """Решето Эратосфена для нахождения всех простых до limit"""
+        table = prime_table.TABLE
+        if table is not None and limit <= table.limit:
+            return table.sieve(limit)
         sieve = [True] * (limit + 1)
         sieve[0] = sieve[1] = False
         for i in range(2, int(limit ** 0.5) + 1):
@@ -260,6 +268,14 @@ def euler_phi_factor(n: int) -> int:
     return result
 
 
+def euler_phi(n: int) -> int:
+    """Вычисляет φ(n): по таблице prime_table, если она загружена, иначе через разложение"""
+    table = prime_table.TABLE
+    if table is not None and table.phi_values is not None and 0 < n <= table.limit:
+        return table.phi(n)
+    return euler_phi_factor(n)
+
+
 def compare_euler_phi_methods(test_values: List[int]) -> dict:
     """
     Сравнивает время работы трёх методов на заданных значениях.
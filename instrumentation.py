@@ -0,0 +1,187 @@
+from typing import Dict, Iterable, Optional
+from types import FunctionType, ModuleType
+import functools
+import importlib
+import time
+
+# Счетчики операций: имя операции -> функции, вызовы которых она считает.
+# multiplicative_order_steps также пополняется из ModularContext через count()
+OPERATIONS = {
+    'is_prime': ('easy.is_prime',),
+    'gcd': ('easy.gcd', 'normal.gcd'),
+    'multiplicative_order_steps': ('normal.multiplicative_order',),
+}
+
+_active: Optional['Instrumentation'] = None
+
+
+class Instrumentation:
+    """
+    Опциональный сбор статистики по функциям easy.py и normal.py:
+    число вызовов, суммарное время (perf_counter_ns) и счетчики операций
+    (is_prime, gcd, шаги вычисления порядков в multiplicative_order и
+    ModularContext, Poly.eval).
+
+    Пока сбор выключен, модули содержат исходные функции без обёрток,
+    поэтому накладных расходов нет. При включении обёртки подставляются
+    в глобальные имена модулей, при выключении — снимаются.
+    Вызовы через имена, импортированные заранее (from easy import is_prime),
+    не учитываются.
+    """
+
+    def __init__(self, modules: Iterable[str] = ('easy', 'normal')):
+        self.modules = tuple(modules)
+        self.calls: Dict[str, int] = {}
+        self.time_ns: Dict[str, int] = {}
+        self.ops: Dict[str, int] = {name: 0 for name in OPERATIONS}
+        self.ops['poly_eval'] = 0
+        self._patched = []
+
+    def reset(self) -> None:
+        """Обнуляет накопленную статистику"""
+        self.calls.clear()
+        self.time_ns.clear()
+        for name in self.ops:
+            self.ops[name] = 0
+
+    def _wrap(self, qualname: str, func):
+        calls = self.calls
+        time_ns = self.time_ns
+        ops = self.ops
+        op = next((name for name, funcs in OPERATIONS.items() if qualname in funcs), None)
+        counter = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                calls[qualname] = calls.get(qualname, 0) + 1
+                time_ns[qualname] = time_ns.get(qualname, 0) + counter() - start
+            if op == 'multiplicative_order_steps':
+                # Цикл делает order умножений, -1 означает, что порядок не определён
+                if result > 0:
+                    ops[op] += result
+            elif op is not None:
+                ops[op] += 1
+            return result
+
+        return wrapper
+
+    def _patch(self, owner, name: str, new) -> None:
+        self._patched.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, new)
+
+    def enable(self) -> 'Instrumentation':
+        """Подставляет обёртки во все функции модулей"""
+        global _active
+        if _active is not None:
+            raise RuntimeError("Сбор статистики уже включен")
+
+        try:
+            for module_name in self.modules:
+                module = importlib.import_module(module_name)
+                for name, obj in list(vars(module).items()):
+                    qualname = f"{module_name}.{name}"
+                    is_own = isinstance(obj, FunctionType) and obj.__module__ == module_name
+                    is_op = any(qualname in funcs for funcs in OPERATIONS.values())
+                    if (is_own and not name.startswith('_')) or (is_op and callable(obj)):
+                        self._patch(module, name, self._wrap(qualname, obj))
+
+                if module_name == 'normal':
+                    self._patch_poly_eval(module)
+        except Exception:
+            self.disable()
+            raise
+
+        _active = self
+        return self
+
+    def _patch_poly_eval(self, module: ModuleType) -> None:
+        poly_cls = module.Poly
+        original = poly_cls.eval
+        ops = self.ops
+
+        @functools.wraps(original)
+        def eval_wrapper(*args, **kwargs):
+            ops['poly_eval'] += 1
+            return original(*args, **kwargs)
+
+        self._patch(poly_cls, 'eval', eval_wrapper)
+
+    def disable(self) -> None:
+        """Возвращает исходные функции"""
+        global _active
+        while self._patched:
+            owner, name, original = self._patched.pop()
+            setattr(owner, name, original)
+        if _active is self:
+            _active = None
+
+    def __enter__(self) -> 'Instrumentation':
+        return self.enable()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.disable()
+
+    def as_dict(self) -> dict:
+        """Статистика в виде словаря"""
+        return {
+            'functions': {
+                name: {'calls': self.calls[name], 'time_ns': self.time_ns[name]}
+                for name in sorted(self.calls)
+            },
+            'operations': dict(self.ops)
+        }
+
+    def to_prometheus(self, prefix: str = 'shokhin') -> str:
+        """Статистика в текстовом формате Prometheus"""
+        lines = [
+            f"# HELP {prefix}_function_calls_total Число вызовов функции",
+            f"# TYPE {prefix}_function_calls_total counter",
+        ]
+        for name in sorted(self.calls):
+            lines.append(f'{prefix}_function_calls_total{{function="{name}"}} {self.calls[name]}')
+
+        lines += [
+            f"# HELP {prefix}_function_time_seconds_total Суммарное время выполнения функции",
+            f"# TYPE {prefix}_function_time_seconds_total counter",
+        ]
+        for name in sorted(self.time_ns):
+            lines.append(f'{prefix}_function_time_seconds_total{{function="{name}"}} {self.time_ns[name] / 1e9:.9f}')
+
+        lines += [
+            f"# HELP {prefix}_operations_total Число элементарных операций",
+            f"# TYPE {prefix}_operations_total counter",
+        ]
+        for name in sorted(self.ops):
+            lines.append(f'{prefix}_operations_total{{operation="{name}"}} {self.ops[name]}')
+
+        return "\n".join(lines) + "\n"
+
+
+def instrument(modules: Iterable[str] = ('easy', 'normal')) -> Instrumentation:
+    """
+    Создает объект сбора статистики для использования как контекстного менеджера:
+
+        with instrument() as stats:
+            normal.order_of_sr(N)
+        print(stats.to_prometheus())
+    """
+    return Instrumentation(modules)
+
+
+def count(op: str, amount: int = 1) -> None:
+    """
+    Добавляет amount к счетчику операции, если сбор статистики включен.
+    Для работы, которая не проходит через обёрнутые функции (например,
+    таблицы порядков ModularContext).
+    """
+    if _active is not None:
+        _active.ops[op] += amount
+
+
+def active() -> Optional[Instrumentation]:
+    """Текущий включенный сбор статистики или None"""
+    return _active
@@ -1,8 +1,16 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple, FrozenSet, Iterable, Iterator, Union, IO, Optional, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import permutations
+import json
+import math
 import random
-from sympy import symbols, Poly, isprime
-from sympy.combinatorics import Permutation
-from sympy.combinatorics.named_groups import SymmetricGroup
+from sympy import symbols, Poly
+from sympy.combinatorics import Permutation, PermutationGroup
+from sympy.combinatorics.named_groups import SymmetricGroup, AlternatingGroup
+
+import instrumentation
+import prime_table
 
 def get_parameters(N: int) -> Dict[str, int]:
     """Вычисляет все параметры на основе N"""
@@ -70,6 +78,16 @@ def multiplicative_order(a: int, n: int) -> int:
 def get_prime_factors(n: int) -> List[int]:
     """Находит простые делители числа"""
     factors = []
+
+    # Разложение по таблице наименьших простых делителей
+    table = prime_table.TABLE
+    if table is not None and table.spf_values is not None and 1 < n <= table.limit:
+        while n > 1:
+            d = table.spf(n)
+            factors.append(d)
+            n //= d
+        return factors
+
     d = 2
     while d * d <= n:
         while n % d == 0:
@@ -80,72 +98,640 @@ def get_prime_factors(n: int) -> List[int]:
         factors.append(n)
     return factors
 
-def subgroups_of_Sm(N: int) -> dict:
-    """Находит все подгруппы симметрической группы S_m"""
-    params = get_parameters(N)
-    m = params['m']
 
-    try:
-        # Создаем симметрическую группу S_m
-        S_m = SymmetricGroup(m)
+def factorize(n: int) -> Dict[int, int]:
+    """Разложение числа в виде {простой делитель: степень}"""
+    factors = {}
+    for q in get_prime_factors(n):
+        factors[q] = factors.get(q, 0) + 1
+    return factors
 
-        all_subgroups = []
-        all_subgroups.append(S_m)
 
-        # Добавляем знакопеременную группу если m >= 2
-        if m >= 2:
-            try:
-                A_m = S_m.alternating_group()
-                all_subgroups.append(A_m)
-            except:
-                pass
+class ModularContext:
+    """
+    Предвычисленные данные о мультипликативной группе Z_m^*:
+    элементы, phi(m), функция Кармайкла lambda(m), разложение m,
+    порядки всех элементов и, для циклической группы, образующая
+    и таблица дискретных логарифмов. Всё считается за один проход.
+    order_steps — число модульных умножений и возведений в степень,
+    потраченных на порядки (учитывается в счетчике multiplicative_order_steps).
+    """
+    __slots__ = ('m', 'units', 'phi', 'carmichael', 'factorization',
+                 'generator', 'dlog', 'orders', 'order_steps')
+
+    def __init__(self, m: int):
+        self.m = m
+        self.units: Tuple[int, ...] = tuple(x for x in range(1, m) if gcd(x, m) == 1)
+        self.phi = len(self.units)
+
+        self.factorization: Dict[int, int] = factorize(m)
+
+        # lambda(m) = НОК lambda(q^e), причем lambda(2^e) = 2^(e-2) при e >= 3
+        self.carmichael = 1
+        for q, e in self.factorization.items():
+            part = q ** (e - 1) * (q - 1)
+            if q == 2 and e >= 3:
+                part //= 2
+            self.carmichael = math.lcm(self.carmichael, part)
+
+        self.generator: Optional[int] = None
+        self.dlog: Optional[Dict[int, int]] = None
+        self.orders: Dict[int, int] = {}
+        self.order_steps = 0
+
+        if not self.units:
+            return
+
+        steps = 0
+        lambda_primes = set(get_prime_factors(self.carmichael))
+        if self.carmichael == self.phi:
+            # Группа циклическая: находим образующую и строим таблицу логарифмов
+            for g in self.units:
+                is_generator = True
+                for q in lambda_primes:
+                    steps += 1
+                    if pow(g, self.phi // q, m) == 1:
+                        is_generator = False
+                        break
+                if is_generator:
+                    self.generator = g
+                    break
+            self.dlog = {}
+            power = 1 % m
+            for i in range(self.phi):
+                self.dlog[power] = i
+                self.orders[power] = self.phi // gcd(i, self.phi)
+                power = power * self.generator % m
+            steps += self.phi
+        else:
+            for a in self.units:
+                order = self.carmichael
+                for q in lambda_primes:
+                    while order % q == 0:
+                        steps += 1
+                        if pow(a, order // q, m) != 1:
+                            break
+                        order //= q
+                self.orders[a] = order
+
+        self.order_steps = steps
+        instrumentation.count('multiplicative_order_steps', steps)
+
+    @property
+    def is_cyclic(self) -> bool:
+        return self.generator is not None
+
+    def order(self, a: int) -> int:
+        """Порядок a в Z_m^* (-1, если a не обратим)"""
+        return self.orders.get(a % self.m, -1)
+
+    def generators(self) -> List[int]:
+        """Все образующие Z_m^* (пусто, если группа не циклическая)"""
+        return [a for a in self.units if self.orders[a] == self.phi]
+
+    def cyclic_subgroup(self, a: int) -> List[int]:
+        """Степени a^0, a^1, ..., a^(ord-1) по модулю m"""
+        a %= self.m
+        subgroup = []
+        power = 1 % self.m
+        for _ in range(self.order(a)):
+            subgroup.append(power)
+            power = power * a % self.m
+        return subgroup
+
+    def subgroup_of_order(self, d: int) -> List[int]:
+        """Единственная подгруппа порядка d циклической группы (по возрастанию)"""
+        return [a for a in self.units if d % self.orders[a] == 0]
+
+
+@lru_cache(maxsize=64)
+def modular_context(m: int) -> ModularContext:
+    """ModularContext для модуля m с LRU-кэшем"""
+    return ModularContext(m)
+
+
+# Аддитивная группа Z_m: все ответы строятся по делителям m.
+# Элементы порядка k — это x = (m/k)*u, gcd(u, k) = 1, поэтому вместо списков
+# возвращаются ленивые последовательности с памятью O(число делителей),
+# которые сравниваются со списками поэлементно.
+
+def divisors(n: int) -> List[int]:
+    """Все делители n по возрастанию"""
+    result = [1]
+    for q, e in factorize(n).items():
+        result = [d * q ** i for d in result for i in range(e + 1)]
+    return sorted(result)
+
+
+def euler_phi(n: int) -> int:
+    """phi(n): по таблице prime_table, если она загружена, иначе через разложение"""
+    table = prime_table.TABLE
+    if table is not None and table.phi_values is not None and 0 < n <= table.limit:
+        return table.phi(n)
+
+    result = n
+    for q in factorize(n):
+        result -= result // q
+    return result
+
+
+class CoprimeResidues(Sequence):
+    """Ленивая последовательность u из range(n) с gcd(u, n) == 1 по возрастанию"""
+    __slots__ = ('n', '_primes', '_mobius', '_len')
+
+    def __init__(self, n: int):
+        self.n = n
+        self._primes = tuple(factorize(n))
+        # Бесквадратные делители rad(n) со знаком функции Мёбиуса
+        self._mobius = [(1, 1)]
+        for q in self._primes:
+            self._mobius += [(d * q, -mu) for d, mu in self._mobius]
+        self._len = euler_phi(n) if n > 1 else n
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        primes = self._primes
+        for u in range(self.n):
+            if all(u % q for q in primes):
+                yield u
+
+    def __contains__(self, u) -> bool:
+        return isinstance(u, int) and 0 <= u < self.n and gcd(u, self.n) == 1
+
+    def _count_upto(self, x: int) -> int:
+        """Число взаимно простых с n чисел в [0, x] (включение-исключение)"""
+        return sum(mu * (x // d + 1) for d, mu in self._mobius)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError('CoprimeResidues index out of range')
+        # Наименьшее u с _count_upto(u) > i
+        lo, hi = 0, self.n - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._count_upto(mid) > i:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def __eq__(self, other) -> bool:
+        return _sequence_eq(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CoprimeResidues({self.n})"
+
+
+class MultiplesView(Sequence):
+    """
+    Ленивая последовательность (a * i) % m для i из indices.
+    Предполагается, что indices лежат в range(m // gcd(a, m)),
+    тогда все значения различны.
+    """
+    __slots__ = ('a', 'm', 'indices')
+
+    def __init__(self, a: int, m: int, indices: Sequence):
+        self.a = a
+        self.m = m
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[int]:
+        a, m = self.a, self.m
+        for i in self.indices:
+            yield a * i % m
+
+    def __contains__(self, x) -> bool:
+        if not isinstance(x, int) or not 0 <= x < self.m:
+            return False
+        g = gcd(self.a, self.m)
+        if x % g:
+            return False
+        period = self.m // g
+        i = (x // g) * pow(self.a // g, -1, period) % period if period > 1 else 0
+        return i in self.indices
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.a * j % self.m for j in self.indices[i]]
+        return self.a * self.indices[i] % self.m
+
+    def __eq__(self, other) -> bool:
+        return _sequence_eq(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"MultiplesView(a={self.a}, m={self.m}, indices={self.indices!r})"
+
+
+def _sequence_eq(view: Sequence, other) -> bool:
+    """Поэлементное сравнение ленивой последовательности со списком, кортежем и т.п."""
+    if not isinstance(other, (Sequence, range)) or isinstance(other, str):
+        return NotImplemented
+    return len(view) == len(other) and all(x == y for x, y in zip(view, other))
+
+
+def additive_order_counts(m: int) -> Dict[int, int]:
+    """Число элементов каждого порядка d | m в Z_m: {d: phi(d)}"""
+    return {d: euler_phi(d) for d in divisors(m)}
+
+
+def additive_kernel(m: int, k: int) -> MultiplesView:
+    """Элементы x из Z_m с k*x = 0: кратные m / gcd(k, m)"""
+    g = gcd(k, m)
+    return MultiplesView(m // g, m, range(g))
+
+
+def elements_of_additive_order(m: int, k: int) -> MultiplesView:
+    """Элементы порядка k в Z_m: (m/k)*u, gcd(u, k) = 1"""
+    if m % k:
+        return MultiplesView(1, m, range(0))
+    return MultiplesView(m // k, m, CoprimeResidues(k))
+
+
+def additive_cyclic_subgroup(m: int, t: int) -> Tuple[MultiplesView, MultiplesView]:
+    """
+    Подгруппа <t> в Z_m в порядке 0, t, 2t, ... и её образующие i*t
+    с gcd(i, |<t>|) = 1
+    """
+    t %= m
+    size = m // gcd(m, t)
+    return MultiplesView(t, m, range(size)), MultiplesView(t, m, CoprimeResidues(size))
+
+# Результаты функций хранят сырые данные (массивы перестановок, коэффициенты),
+# строки строятся только по запросу через as_dict()
+
+@dataclass(slots=True)
+class SubgroupsOfSmResult:
+    """Результат subgroups_of_Sm: подгруппы как frozenset рангов перестановок"""
+    m: int
+    total_subgroups: int
+    random_subgroup: FrozenSet[int]
+    selected_subgroup: FrozenSet[int]
+    left_cosets: int
+    right_cosets: int
+    subgroup_index: int
+    is_normal: bool
 
-        # Добавляем несколько циклических подгрупп
-        elements_to_check = S_m.elements[:min(20, len(S_m.elements))]
-        for el in elements_to_check:
-            try:
-                cyclic_sub = el.cyclic_subgroup()
-                # Проверяем, что это новая подгруппа
-                if not any(sub.is_subgroup(cyclic_sub) for sub in all_subgroups):
-                    all_subgroups.append(cyclic_sub)
-            except:
-                continue
+    def as_dict(self) -> dict:
+        return {
+            'total_subgroups': self.total_subgroups,
+            'random_subgroup': _Sm_subgroup_str(self.m, self.random_subgroup)[:100] + "...",
+            'selected_subgroup': _Sm_subgroup_str(self.m, self.selected_subgroup)[:100] + "...",
+            'left_cosets': self.left_cosets,
+            'right_cosets': self.right_cosets,
+            'subgroup_index': self.subgroup_index,
+            'is_normal': self.is_normal
+        }
+
+    def to_record(self) -> dict:
+        return {
+            'm': self.m,
+            'total_subgroups': self.total_subgroups,
+            'random_subgroup': sorted(self.random_subgroup),
+            'selected_subgroup': sorted(self.selected_subgroup),
+            'left_cosets': self.left_cosets,
+            'right_cosets': self.right_cosets,
+            'subgroup_index': self.subgroup_index,
+            'is_normal': self.is_normal
+        }
 
-        if all_subgroups:
-            random_subgroup = random.choice(all_subgroups)
-            index = N % len(all_subgroups)
-            selected_subgroup = all_subgroups[index]
 
-            # Смежные классы
-            try:
-                left_cosets = selected_subgroup.left_coset_decomposition()
-                right_cosets = selected_subgroup.right_coset_decomposition()
-                left_count = len(left_cosets)
-                right_count = len(right_cosets)
-            except:
-                left_count = right_count = 0
+@dataclass(slots=True)
+class ElementPowersResult:
+    """Результат element_powers_in_Sm: перестановки в форме массива"""
+    g: Tuple[int, ...]
+    g_n1: Tuple[int, ...]
+    order_g_n1: int
+    g_n2: Tuple[int, ...]
+    order_g_n2: int
+    g_n3: Tuple[int, ...]
+    order_g_n3: int
 
-            subgroup_index = S_m.order() // selected_subgroup.order()
-            is_normal = selected_subgroup.is_normal(S_m)
-        else:
-            random_subgroup = selected_subgroup = "Не найдено"
-            left_count = right_count = 0
-            subgroup_index = is_normal = 0
+    def as_dict(self) -> dict:
+        return {
+            'g': str(Permutation(list(self.g))),
+            'g_n1': str(Permutation(list(self.g_n1))), 'order_g_n1': self.order_g_n1,
+            'g_n2': str(Permutation(list(self.g_n2))), 'order_g_n2': self.order_g_n2,
+            'g_n3': str(Permutation(list(self.g_n3))), 'order_g_n3': self.order_g_n3
+        }
+
+    def to_record(self) -> dict:
+        return {
+            'g': list(self.g),
+            'g_n1': list(self.g_n1), 'order_g_n1': self.order_g_n1,
+            'g_n2': list(self.g_n2), 'order_g_n2': self.order_g_n2,
+            'g_n3': list(self.g_n3), 'order_g_n3': self.order_g_n3
+        }
+
+
+@dataclass(slots=True)
+class SigmaPowerResult:
+    """Результат solve_sigma_power_eq: решения в форме массива"""
+    m: int
+    n: int
+    total_solutions: int
+    random_solutions: List[Tuple[int, ...]]
+
+    def as_dict(self) -> dict:
+        return {
+            'total_solutions': self.total_solutions,
+            'random_solutions': [str(Permutation(list(sol))) for sol in self.random_solutions],
+            'common_properties': f"Все решения имеют порядок, делящий {self.n}, "
+                                 f"и являются {self.n}-ми корнями из цикла длины {self.m - 1}"
+        }
+
+    def to_record(self) -> dict:
+        return {
+            'm': self.m,
+            'n': self.n,
+            'total_solutions': self.total_solutions,
+            'random_solutions': [list(sol) for sol in self.random_solutions]
+        }
+
+
+def _poly_str(coeffs: List[int], modulus: int) -> str:
+    """Строковое представление полинома над Z_modulus по коэффициентам"""
+    return str(Poly(coeffs, symbols('x'), modulus=modulus))
+
+
+def _poly_coeffs(poly: Poly) -> List[int]:
+    """Коэффициенты полинома (от старшего) как вычеты 0..p-1"""
+    modulus = int(poly.get_modulus())
+    return [int(c) % modulus for c in poly.all_coeffs()]
+
+
+@dataclass(slots=True)
+class PolynomialGcdResult:
+    """Результат polynomial_gcd: полиномы как списки коэффициентов"""
+    modulus: int
+    f: List[int]
+    g: List[int]
+    gcd: List[int]
+    gcd_degree: int
 
+    def as_dict(self) -> dict:
         return {
-            'total_subgroups': len(all_subgroups),
-            'random_subgroup': str(random_subgroup)[:100] + "...",
-            'selected_subgroup': str(selected_subgroup)[:100] + "...",
-            'left_cosets': left_count,
-            'right_cosets': right_count,
-            'subgroup_index': subgroup_index,
-            'is_normal': is_normal
+            'f': _poly_str(self.f, self.modulus),
+            'g': _poly_str(self.g, self.modulus),
+            'gcd': _poly_str(self.gcd, self.modulus),
+            'gcd_degree': self.gcd_degree
         }
+
+    def to_record(self) -> dict:
+        return {
+            'modulus': self.modulus,
+            'f': self.f,
+            'g': self.g,
+            'gcd': self.gcd,
+            'gcd_degree': self.gcd_degree
+        }
+
+
+@dataclass(slots=True)
+class PolynomialInverseResult:
+    """Результат polynomial_inverse: полиномы как списки коэффициентов"""
+    modulus: int
+    f: List[int]
+    g: List[int]
+    inverse: List[int]
+    verification: List[int]
+
+    def as_dict(self) -> dict:
+        return {
+            'f': _poly_str(self.f, self.modulus),
+            'g': _poly_str(self.g, self.modulus),
+            'inverse': _poly_str(self.inverse, self.modulus),
+            'verification': _poly_str(self.verification, self.modulus)
+        }
+
+    def to_record(self) -> dict:
+        return {
+            'modulus': self.modulus,
+            'f': self.f,
+            'g': self.g,
+            'inverse': self.inverse,
+            'verification': self.verification
+        }
+
+
+@dataclass(slots=True)
+class IrreduciblePolynomialsResult:
+    """Результат generate_irreducible_polynomials: полиномы как кортежи коэффициентов"""
+    q: int
+    d: int
+    polynomials: List[Tuple[int, ...]]
+
+    def as_dict(self) -> dict:
+        return {
+            'q': self.q,
+            'd': self.d,
+            'polynomials': [_poly_str(list(coeffs), self.q) for coeffs in self.polynomials]
+        }
+
+    def to_record(self) -> dict:
+        return {
+            'q': self.q,
+            'd': self.d,
+            'polynomials': [list(coeffs) for coeffs in self.polynomials]
+        }
+
+
+def _json_default(obj):
+    """Ленивые последовательности (MultiplesView, CoprimeResidues) пишутся как списки"""
+    if isinstance(obj, (MultiplesView, CoprimeResidues)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_results_jsonl(results: Iterable, fp: IO[str]) -> int:
+    """
+    Записывает результаты в формате JSON Lines (одна компактная запись на строку).
+    Объекты результатов пишутся через to_record() без строкового рендеринга,
+    словари (в том числе с ошибками) — как есть.
+    Возвращает число записанных строк.
+    """
+    count = 0
+    for result in results:
+        if hasattr(result, 'to_record'):
+            record = {'type': type(result).__name__, **result.to_record()}
+        else:
+            record = result
+        fp.write(json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=_json_default))
+        fp.write('\n')
+        count += 1
+    return count
+
+
+@lru_cache(maxsize=None)
+def _Sm_elements(m: int) -> Tuple[Tuple[int, ...], ...]:
+    """Все перестановки S_m в лексикографическом порядке (индекс = ранг)"""
+    return tuple(permutations(range(m)))
+
+
+@lru_cache(maxsize=None)
+def _Sm_ranks(m: int) -> Dict[Tuple[int, ...], int]:
+    """Таблица перестановка -> ранг"""
+    return {perm: rank for rank, perm in enumerate(_Sm_elements(m))}
+
+
+def _cycle_type(perm: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Цикловой тип перестановки (длины циклов по убыванию)"""
+    seen = [False] * len(perm)
+    lengths = []
+    for start in range(len(perm)):
+        if not seen[start]:
+            length = 0
+            i = start
+            while not seen[i]:
+                seen[i] = True
+                i = perm[i]
+                length += 1
+            lengths.append(length)
+    return tuple(sorted(lengths, reverse=True))
+
+
+@lru_cache(maxsize=None)
+def _Sm_cycle_types(m: int) -> Tuple[Tuple[int, ...], ...]:
+    """Цикловые типы всех элементов S_m по рангам"""
+    return tuple(_cycle_type(perm) for perm in _Sm_elements(m))
+
+
+def _conjugacy_class_size(m: int, cycle_type: Tuple[int, ...]) -> int:
+    """Размер класса сопряженности S_m: m! / prod(k^c_k * c_k!)"""
+    centralizer = 1
+    for k in set(cycle_type):
+        c = cycle_type.count(k)
+        centralizer *= k ** c * math.factorial(c)
+    return math.factorial(m) // centralizer
+
+
+@lru_cache(maxsize=None)
+def cyclic_subgroups_of_Sm(m: int) -> Tuple[Tuple[Tuple[int, ...], Tuple[FrozenSet[int], ...]], ...]:
+    """
+    Находит все циклические подгруппы S_m.
+    Возвращает кортеж пар (цикловой тип образующей, (подгруппа, ...)),
+    где подгруппа — frozenset рангов перестановок.
+    Цикловой тип совпадает с классом сопряженности циклических подгрупп.
+    Результат кэшируется, поэтому он неизменяемый.
+    """
+    elements = _Sm_elements(m)
+    ranks = _Sm_ranks(m)
+    types = _Sm_cycle_types(m)
+    identity = elements[0]
+
+    seen = bytearray(len(elements))
+    classes = {}
+    for rank, g in enumerate(elements):
+        if seen[rank]:
+            continue
+
+        # Степени g: g^1, g^2, ..., g^order = e
+        powers = [rank]
+        power = g
+        while power != identity:
+            power = tuple(g[i] for i in power)
+            powers.append(ranks[power])
+        order = len(powers)
+
+        # Все образующие <g> порождают ту же подгруппу
+        for i in range(1, order + 1):
+            if gcd(i, order) == 1:
+                seen[powers[i - 1]] = 1
+
+        classes.setdefault(types[rank], []).append(frozenset(powers))
+
+    return tuple((cycle_type, tuple(subs)) for cycle_type, subs in classes.items())
+
+
+@lru_cache(maxsize=None)
+def _Sm_subgroups(m: int) -> Tuple[FrozenSet[int], ...]:
+    """S_m, A_m и все циклические подгруппы S_m без повторов"""
+    types = _Sm_cycle_types(m)
+    S_m = frozenset(range(len(types)))
+    A_m = frozenset(r for r, ct in enumerate(types) if (m - len(ct)) % 2 == 0)
+
+    subgroups = [S_m]
+    if A_m != S_m:
+        subgroups.append(A_m)
+    known = set(subgroups)
+
+    # Циклические подгруппы по возрастанию порядка, затем по рангам элементов
+    cyclic = [sub for _, subs in cyclic_subgroups_of_Sm(m) for sub in subs]
+    for sub in sorted(cyclic, key=lambda sub: (len(sub), sorted(sub))):
+        if sub not in known:
+            known.add(sub)
+            subgroups.append(sub)
+    return tuple(subgroups)
+
+
+def _is_normal_in_Sm(m: int, subgroup: FrozenSet[int]) -> bool:
+    """Подгруппа нормальна, если она — объединение классов сопряженности"""
+    types = _Sm_cycle_types(m)
+    counts = {}
+    for rank in subgroup:
+        counts[types[rank]] = counts.get(types[rank], 0) + 1
+    return all(count == _conjugacy_class_size(m, ct) for ct, count in counts.items())
+
+
+def _Sm_subgroup_str(m: int, subgroup: FrozenSet[int]) -> str:
+    """Строковое представление подгруппы в виде PermutationGroup"""
+    elements = _Sm_elements(m)
+    if len(subgroup) == len(elements):
+        group = SymmetricGroup(m)
+    elif len(subgroup) * 2 == len(elements) and m > 2:
+        group = AlternatingGroup(m)
+    else:
+        # Циклическая подгруппа порождается элементом максимального порядка
+        types = _Sm_cycle_types(m)
+        generator = max(sorted(subgroup), key=lambda r: math.lcm(*types[r]))
+        group = PermutationGroup([Permutation(list(elements[generator]))])
+    return str(group)
+
+
+def subgroups_of_Sm(N: int) -> Union[SubgroupsOfSmResult, dict]:
+    """Находит все подгруппы симметрической группы S_m"""
+    params = get_parameters(N)
+    m = params['m']
+
+    try:
+        all_subgroups = _Sm_subgroups(m)
+        order = math.factorial(m)
+
+        random_subgroup = random.choice(all_subgroups)
+        index = N % len(all_subgroups)
+        selected_subgroup = all_subgroups[index]
+
+        # Число левых и правых смежных классов равно индексу |S_m| / |H|
+        subgroup_index = order // len(selected_subgroup)
+        is_normal = _is_normal_in_Sm(m, selected_subgroup)
+
+        return SubgroupsOfSmResult(
+            m=m,
+            total_subgroups=len(all_subgroups),
+            random_subgroup=random_subgroup,
+            selected_subgroup=selected_subgroup,
+            left_cosets=subgroup_index,
+            right_cosets=subgroup_index,
+            subgroup_index=subgroup_index,
+            is_normal=is_normal
+        )
     except Exception as e:
         return {'error': f"Ошибка: {e}"}
 
 
-def element_powers_in_Sm(N: int) -> dict:
+def element_powers_in_Sm(N: int) -> Union[ElementPowersResult, dict]:
     """Находит порядки элементов и циклических подгрупп в S_m"""
     params = get_parameters(N)
     m = params['m']
@@ -166,21 +752,21 @@ def element_powers_in_Sm(N: int) -> dict:
         g_n3 = g ** n3
 
         # Порядки элементов
-        order_g_n1 = g_n1.order()
-        order_g_n2 = g_n2.order()
-        order_g_n3 = g_n3.order()
-
-        return {
-            'g': str(g),
-            'g_n1': str(g_n1), 'order_g_n1': order_g_n1,
-            'g_n2': str(g_n2), 'order_g_n2': order_g_n2,
-            'g_n3': str(g_n3), 'order_g_n3': order_g_n3
-        }
+        order_g_n1 = int(g_n1.order())
+        order_g_n2 = int(g_n2.order())
+        order_g_n3 = int(g_n3.order())
+
+        return ElementPowersResult(
+            g=tuple(g.array_form),
+            g_n1=tuple(g_n1.array_form), order_g_n1=order_g_n1,
+            g_n2=tuple(g_n2.array_form), order_g_n2=order_g_n2,
+            g_n3=tuple(g_n3.array_form), order_g_n3=order_g_n3
+        )
     except Exception as e:
         return {'error': f"Ошибка: {e}"}
 
 
-def solve_sigma_power_eq(N: int) -> dict:
+def solve_sigma_power_eq(N: int) -> Union[SigmaPowerResult, dict]:
     """Решает уравнение σ^n = (1 2 3 ... m-1) в S_m"""
     params = get_parameters(N)
     m = params['m']
@@ -201,14 +787,12 @@ def solve_sigma_power_eq(N: int) -> dict:
         else:
             random_solutions = []
 
-        # общие свойства
-        common_properties = f"Все решения имеют порядок, делящий {n}, и являются {n}-ми корнями из цикла длины {m - 1}"
-
-        return {
-            'total_solutions': len(solutions),
-            'random_solutions': [str(sol) for sol in random_solutions],
-            'common_properties': common_properties
-        }
+        return SigmaPowerResult(
+            m=m,
+            n=n,
+            total_solutions=len(solutions),
+            random_solutions=[tuple(sol.array_form) for sol in random_solutions]
+        )
     except Exception as e:
         return {
             'error': f"Ошибка: {e}",
@@ -225,15 +809,13 @@ def elements_of_order_k_in_cyclic_group(N: int) -> dict:
     k = params['k']
 
     # Циклическая группа порядка m (аддитивная)
-    elements_g_k_eq_e = [x for x in range(m) if (x * k) % m == 0]
+    elements_g_k_eq_e = additive_kernel(m, k)
 
-    # Элементы порядка k
-    elements_of_order_k = []
-    if m % k == 0:
-        for x in range(1, m):
-            actual_order = m // gcd(x, m)
-            if actual_order == k:
-                elements_of_order_k.append(x)
+    # Элементы порядка k (ноль, как и раньше, не учитывается при k = 1)
+    if k > 1:
+        elements_of_order_k = elements_of_additive_order(m, k)
+    else:
+        elements_of_order_k = MultiplesView(1, m, range(0))
 
     return {
         'elements_g_k_eq_e': elements_g_k_eq_e,
@@ -248,31 +830,15 @@ def subgroups_of_Zm_star(N: int) -> list:
     m = params['m']
 
     # Мультипликативная группа Z_m^*
-    Zm_star = [x for x in range(1, m) if gcd(x, m) == 1]
+    ctx = modular_context(m)
+    Zm_star = list(ctx.units)
 
     if not Zm_star:
         return []
 
-    # Для простого m группа циклическая
-    if isprime(m):
-        order = len(Zm_star)
-        divisors = [d for d in range(1, order + 1) if order % d == 0]
-        subgroups = []
-
-        for d in divisors:
-            for g in Zm_star:
-                if pow(g, d, m) == 1:
-                    is_minimal = True
-                    prime_factors = [p for p in get_prime_factors(d) if p != 1]
-                    for p in prime_factors:
-                        if d % p == 0 and pow(g, d // p, m) == 1:
-                            is_minimal = False
-                            break
-                    if is_minimal:
-                        subgroup = sorted([pow(g, i, m) for i in range(d)])
-                        subgroups.append(subgroup)
-                        break
-        return subgroups
+    # Для простого m группа циклическая: по одной подгруппе на каждый делитель порядка
+    if ctx.factorization == {m: 1}:
+        return [ctx.subgroup_of_order(d) for d in divisors(ctx.phi)]
     else:
         # Для составного m возвращаем саму группу и тривиальную подгруппу
         return [Zm_star, [1]]
@@ -284,7 +850,7 @@ def order_of_sr(N: int) -> int:
     p, s, r = params['p'], params['s'], params['r']
 
     # Порядок s^r mod p
-    order_s = multiplicative_order(s, p)
+    order_s = modular_context(p).order(s)
     if order_s == -1:
         return -1
     gcd_val = gcd(r, order_s)
@@ -298,7 +864,7 @@ def order_and_primitivity_of_t(N: int) -> dict:
     params = get_parameters(N)
     p, t = params['p'], params['t']
 
-    order_t = multiplicative_order(t, p)
+    order_t = modular_context(p).order(t)
     is_primitive = order_t == p - 1
 
     return {
@@ -312,19 +878,11 @@ def generators_of_Zm_star(N: int) -> list:
     params = get_parameters(N)
     m = params['m']
 
-    Zm_star = [x for x in range(1, m) if gcd(x, m) == 1]
-
-    if not Zm_star:
+    ctx = modular_context(m)
+    if not ctx.units:
         return []
 
-    generators = []
-    group_order = len(Zm_star)
-
-    for g in Zm_star:
-        if multiplicative_order(g, m) == group_order:
-            generators.append(g)
-
-    return generators
+    return ctx.generators()
 
 
 def cyclic_subgroup_in_Zm_additive(N: int) -> dict:
@@ -332,16 +890,10 @@ def cyclic_subgroup_in_Zm_additive(N: int) -> dict:
     params = get_parameters(N)
     m, t = params['m'], params['t']
 
-    # Циклическая подгруппа порожденная t mod m
-    t_mod = t % m
-    gcd_val = gcd(m, t_mod)
-    subgroup_size = m // gcd_val
-    subgroup = [(i * t_mod) % m for i in range(subgroup_size)]
+    # Циклическая подгруппа порожденная t mod m и её порождающие элементы
+    subgroup, generators = additive_cyclic_subgroup(m, t)
     order = len(subgroup)
 
-    # Порождающие элементы подгруппы
-    generators = [x for x in subgroup if gcd(x, m) == gcd_val]
-
     return {
         'subgroup': subgroup,
         'order': order,
@@ -358,8 +910,9 @@ def isomorphism_of_cyclic_subgroup_Zm_star(N: int) -> dict:
     if gcd(t, m) != 1:
         return {'error': 't не взаимно просто с m'}
 
-    order_t = multiplicative_order(t, m)
-    subgroup = [pow(t, i, m) for i in range(order_t)]
+    ctx = modular_context(m)
+    order_t = ctx.order(t)
+    subgroup = ctx.cyclic_subgroup(t)
 
     # Изоморфна циклической группе порядка order_t
     isomorphic_to = f"Z_{order_t}"
@@ -460,7 +1013,7 @@ def polynomial_factorization(N: int) -> dict:
     return results
 
 
-def polynomial_gcd(N: int) -> dict:
+def polynomial_gcd(N: int) -> Union[PolynomialGcdResult, dict]:
     """Находит НОД полиномов и его линейное представление"""
 
     try:
@@ -475,17 +1028,18 @@ def polynomial_gcd(N: int) -> dict:
         # Находим НОД
         gcd_poly = f.gcd(g)
 
-        return {
-            'f': str(f),
-            'g': str(g),
-            'gcd': str(gcd_poly),
-            'gcd_degree': gcd_poly.degree()
-        }
+        return PolynomialGcdResult(
+            modulus=11,
+            f=_poly_coeffs(f),
+            g=_poly_coeffs(g),
+            gcd=_poly_coeffs(gcd_poly),
+            gcd_degree=gcd_poly.degree()
+        )
     except Exception as e:
         return {'error': str(e)}
 
 
-def polynomial_inverse(N: int) -> dict:
+def polynomial_inverse(N: int) -> Union[PolynomialInverseResult, dict]:
     """Находит обратный полином по модулю"""
 
     try:
@@ -499,17 +1053,18 @@ def polynomial_inverse(N: int) -> dict:
         # Находим обратный
         inverse = f.invert(g)
 
-        return {
-            'f': str(f),
-            'g': str(g),
-            'inverse': str(inverse),
-            'verification': str((f * inverse) % g)
-        }
+        return PolynomialInverseResult(
+            modulus=13,
+            f=_poly_coeffs(f),
+            g=_poly_coeffs(g),
+            inverse=_poly_coeffs(inverse),
+            verification=_poly_coeffs((f * inverse) % g)
+        )
     except Exception as e:
         return {'error': f'Обратный элемент не существует или ошибка: {e}'}
 
 
-def generate_irreducible_polynomials(q: int, d: int) -> list:
+def generate_irreducible_polynomials(q: int, d: int) -> IrreduciblePolynomialsResult:
     """Генерирует все неприводимые полиномы степени d над F_q"""
     from itertools import product
 
@@ -529,6 +1084,6 @@ def generate_irreducible_polynomials(q: int, d: int) -> list:
                     break
 
             if is_irred:
-                irreducible_polys.append(str(poly))
+                irreducible_polys.append(coeffs)
 
-    return irreducible_polys
\ No newline at end of file
+    return IrreduciblePolynomialsResult(q=q, d=d, polynomials=irreducible_polys)
\ No newline at end of file
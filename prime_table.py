@@ -0,0 +1,298 @@
+from typing import List, Optional
+from array import array
+import argparse
+import mmap
+import os
+import struct
+import sys
+import warnings
+import zlib
+
+# Формат файла (little-endian):
+#   заголовок HEADER (HEADER_SIZE байт): сигнатура, версия, флаги, граница limit,
+#   смещения и длины секций, crc32 заголовка (с нулевым полем crc32) и всех секций;
+#   секция простых — битовое множество на limit + 1 бит (бит n = 1, если n простое);
+#   секции phi и spf (необязательные) — массивы uint32 длины limit + 1.
+MAGIC = b'SHPT'
+VERSION = 2
+HEADER = struct.Struct('<4sHHQQQQQQQI')
+HEADER_SIZE = 128
+FLAG_PHI = 1
+FLAG_SPF = 2
+
+# Путь к таблице для автоматической загрузки при импорте
+ENV_VAR = 'SHOKHIN_PRIME_TABLE'
+
+# Текущая таблица, которую easy.py и normal.py используют как первый уровень поиска
+TABLE: Optional['PrimeTable'] = None
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _sieve(limit: int) -> bytearray:
+    """Решето Эратосфена: байт n равен 1, если n простое"""
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0:2] = b'\x00\x00'[:limit + 1]
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return sieve
+
+
+def _pack_bits(sieve: bytearray) -> bytes:
+    """Упаковывает байты 0/1 в биты (младший бит — меньшее число)"""
+    padded = bytes(sieve) + bytes(-len(sieve) % 8)
+    size = len(padded) // 8
+    # Каждый байт среза равен 0 или 1, поэтому сдвиг на shift < 8 не переносит биты
+    packed = 0
+    for shift in range(8):
+        packed |= int.from_bytes(padded[shift::8], 'little') << shift
+    return packed.to_bytes(size, 'little')
+
+
+def _smallest_prime_factors(limit: int, sieve: bytearray) -> array:
+    """spf[n] — наименьший простой делитель n (0 для n < 2)"""
+    spf = array('I', bytes(4 * (limit + 1)))
+    # Идем от больших простых к меньшим, чтобы наименьший делитель записался последним
+    for p in reversed(range(2, int(limit ** 0.5) + 1)):
+        if sieve[p]:
+            count = len(range(p * p, limit + 1, p))
+            spf[p * p::p] = array('I', [p]) * count
+    for p in range(2, limit + 1):
+        if sieve[p]:
+            spf[p] = p
+    return spf
+
+
+def _phi_from_spf(limit: int, spf: array) -> array:
+    """phi[n] по рекуррентности phi(n) = phi(n/p) * (p или p - 1), p = spf[n]"""
+    phi = array('I', bytes(4 * (limit + 1)))
+    if limit >= 1:
+        phi[1] = 1
+    for n in range(2, limit + 1):
+        p = spf[n]
+        rest = n // p
+        phi[n] = phi[rest] * (p if rest % p == 0 else p - 1)
+    return phi
+
+
+def build_table(path: str, limit: int, with_phi: bool = False, with_spf: bool = False) -> None:
+    """Строит файл таблицы простых (и, по желанию, phi и spf) до limit включительно"""
+    if not 1 <= limit < 2 ** 32:
+        raise ValueError("limit должен быть в диапазоне [1, 2^32)")
+
+    sieve = _sieve(limit)
+    sections = [_pack_bits(sieve)]
+    flags = 0
+    if with_phi or with_spf:
+        spf = _smallest_prime_factors(limit, sieve)
+        if with_phi:
+            sections.append(_to_little_endian(_phi_from_spf(limit, spf)))
+            flags |= FLAG_PHI
+        if with_spf:
+            sections.append(_to_little_endian(spf))
+            flags |= FLAG_SPF
+
+    # Смещения секций; отсутствующая секция имеет нулевые смещение и длину
+    layout = []
+    offset = HEADER_SIZE
+    for section in sections:
+        layout.append((offset, len(section)))
+        offset = _align(offset + len(section))
+    bits_layout = layout[0]
+    phi_layout = layout[1] if flags & FLAG_PHI else (0, 0)
+    spf_layout = layout[-1] if flags & FLAG_SPF else (0, 0)
+
+    fields = (MAGIC, VERSION, flags, limit, *bits_layout, *phi_layout, *spf_layout)
+    checksum = zlib.crc32(_header_bytes(*fields, 0))
+    for section in sections:
+        checksum = zlib.crc32(section, checksum)
+
+    header = _header_bytes(*fields, checksum)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        for (section_offset, _), section in zip(layout, sections):
+            f.write(bytes(section_offset - f.tell()))
+            f.write(section)
+    # Атомарная замена: работающие процессы продолжают видеть старый файл
+    os.replace(tmp_path, path)
+
+
+def _header_bytes(*fields) -> bytes:
+    return HEADER.pack(*fields).ljust(HEADER_SIZE, b'\x00')
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class PrimeTable:
+    """
+    Таблица простых, отображенная в память только для чтения.
+    Все процессы на машине разделяют одну копию страниц файла;
+    секции доступны как memoryview (или массивы NumPy) без копирования.
+    """
+
+    def __init__(self, path: str, verify: bool = True):
+        if sys.byteorder != 'little':
+            raise ValueError("Таблица поддерживается только на little-endian платформах")
+
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = []
+        self.bits = self.phi_values = self.spf_values = None
+
+        try:
+            if len(self._mmap) < HEADER_SIZE:
+                raise ValueError(f"{path}: файл слишком короткий")
+            (magic, version, flags, limit, bits_off, bits_len,
+             phi_off, phi_len, spf_off, spf_len, checksum) = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: неверная сигнатура {magic!r}")
+            if version != VERSION:
+                raise ValueError(f"{path}: неподдерживаемая версия {version}")
+            if max(bits_off + bits_len, phi_off + phi_len, spf_off + spf_len) > len(self._mmap):
+                raise ValueError(f"{path}: файл обрезан")
+            # Секции должны покрывать все числа до limit
+            if (bits_len < limit // 8 + 1
+                    or flags & FLAG_PHI and phi_len != 4 * (limit + 1)
+                    or flags & FLAG_SPF and spf_len != 4 * (limit + 1)):
+                raise ValueError(f"{path}: размеры секций не соответствуют limit = {limit}")
+
+            self.path = path
+            self.limit = limit
+            self.bits = self._section(bits_off, bits_len)
+            if flags & FLAG_PHI:
+                self.phi_values = self._section(phi_off, phi_len).cast('I')
+                self._views.append(self.phi_values)
+            if flags & FLAG_SPF:
+                self.spf_values = self._section(spf_off, spf_len).cast('I')
+                self._views.append(self.spf_values)
+
+            if verify:
+                header = _header_bytes(magic, version, flags, limit, bits_off, bits_len,
+                                       phi_off, phi_len, spf_off, spf_len, 0)
+                actual = zlib.crc32(header)
+                for section in (self.bits, self.phi_values, self.spf_values):
+                    if section is not None:
+                        actual = zlib.crc32(section, actual)
+                if actual != checksum:
+                    raise ValueError(f"{path}: контрольная сумма не совпадает")
+        except Exception:
+            self.close()
+            raise
+
+    def _section(self, offset: int, length: int) -> memoryview:
+        view = memoryview(self._mmap)
+        section = view[offset:offset + length]
+        self._views += [view, section]
+        return section
+
+    def close(self) -> None:
+        """
+        Освобождает представления и закрывает mmap.
+        Если на секции остались внешние ссылки (массивы из as_numpy()),
+        выбрасывает BufferError, и mmap остается открытым.
+        """
+        while self._views:
+            self._views[-1].release()
+            self._views.pop()
+        self._mmap.close()
+        self.bits = self.phi_values = self.spf_values = None
+
+    def __enter__(self) -> 'PrimeTable':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def is_prime(self, n: int) -> bool:
+        """Проверка простоты n <= limit по битовому множеству"""
+        if n < 2:
+            return False
+        return bool(self.bits[n >> 3] >> (n & 7) & 1)
+
+    def phi(self, n: int) -> int:
+        return self.phi_values[n]
+
+    def spf(self, n: int) -> int:
+        return self.spf_values[n]
+
+    def sieve(self, limit: int) -> List[bool]:
+        """Список is_prime для 0..limit, как у решета Эратосфена"""
+        bits = self.bits
+        return [bool(bits[n >> 3] >> (n & 7) & 1) for n in range(limit + 1)]
+
+    def as_numpy(self) -> dict:
+        """
+        Секции таблицы как массивы NumPy без копирования (требуется numpy).
+        Массивы нужно удалить до close(), иначе mmap не закрыть.
+        """
+        import numpy as np
+
+        result = {'bits': np.frombuffer(self.bits, dtype=np.uint8)}
+        if self.phi_values is not None:
+            result['phi'] = np.frombuffer(self.phi_values, dtype='<u4')
+        if self.spf_values is not None:
+            result['spf'] = np.frombuffer(self.spf_values, dtype='<u4')
+        return result
+
+
+def _close_replaced(table: Optional[PrimeTable]) -> None:
+    """Закрывает таблицу, которая больше не текущая"""
+    if table is None:
+        return
+    try:
+        table.close()
+    except BufferError:
+        # На секции ссылаются внешние массивы: mmap закроется вместе с ними
+        warnings.warn(f"{table.path}: таблица используется, mmap оставлен открытым")
+
+
+def load(path: str, verify: bool = True) -> PrimeTable:
+    """Загружает таблицу и делает её текущей для easy.py и normal.py"""
+    global TABLE
+    table = PrimeTable(path, verify=verify)
+    previous, TABLE = TABLE, table
+    _close_replaced(previous)
+    return table
+
+
+def unload() -> None:
+    """Отключает текущую таблицу"""
+    global TABLE
+    previous, TABLE = TABLE, None
+    _close_replaced(previous)
+
+
+def _autoload() -> None:
+    path = os.environ.get(ENV_VAR)
+    if path:
+        try:
+            load(path)
+        except (OSError, ValueError) as e:
+            warnings.warn(f"Таблица простых не загружена: {e}")
+
+
+_autoload()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Построение таблицы простых чисел для easy.py и normal.py")
+    parser.add_argument('path', help="путь к выходному файлу")
+    parser.add_argument('--limit', type=int, required=True, help="верхняя граница (включительно)")
+    parser.add_argument('--phi', action='store_true', help="добавить массив phi")
+    parser.add_argument('--spf', action='store_true', help="добавить массив наименьших простых делителей")
+    args = parser.parse_args()
+    build_table(args.path, args.limit, with_phi=args.phi, with_spf=args.spf)
+
+
+if __name__ == '__main__':
+    main()
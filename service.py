@@ -0,0 +1,234 @@
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+import asyncio
+import os
+import signal
+import threading
+
+import easy
+import normal
+from normal import get_parameters
+
+
+@dataclass(slots=True, frozen=True)
+class ReportTask:
+    """
+    Одна задача отчета.
+    key(N) возвращает класс параметров: для N с одинаковым ключом результат
+    совпадает, поэтому одновременные запросы с одним ключом выполняются один раз.
+    """
+    name: str
+    func: Callable
+    key: Callable[[int], tuple]
+    takes_n: bool = True
+
+
+def _params_key(*names: str) -> Callable[[int], tuple]:
+    """Ключ из значений get_parameters(N), от которых зависит задача"""
+    def key(N: int) -> tuple:
+        params = get_parameters(N)
+        return tuple(params[name] for name in names)
+    return key
+
+
+def _mod_key(*moduli: int) -> Callable[[int], tuple]:
+    """Ключ из остатков N по модулям, от которых зависит задача"""
+    def key(N: int) -> tuple:
+        return tuple(N % q for q in moduli)
+    return key
+
+
+def _n_key(N: int) -> tuple:
+    return (N,)
+
+
+def _constant_key(N: int) -> tuple:
+    return ()
+
+
+def _irreducible_polynomials(N: int) -> normal.IrreduciblePolynomialsResult:
+    params = get_parameters(N)
+    return normal.generate_irreducible_polynomials(params['p_field'], params['m_field'])
+
+
+TASKS: Tuple[ReportTask, ...] = (
+    # easy.py: от N не зависят
+    ReportTask('palindromic_squares_and_circular_primes',
+               easy.palindromic_squares_and_circular_primes, _constant_key, takes_n=False),
+    ReportTask('palindromic_cubes_and_palindromic_primes',
+               easy.palindromic_cubes_and_palindromic_primes, _constant_key, takes_n=False),
+    ReportTask('primes_with_two_digits', easy.primes_with_two_digits, _constant_key, takes_n=False),
+    ReportTask('twin_primes_analysis', easy.twin_primes_analysis, _constant_key, takes_n=False),
+    ReportTask('factorial_plus_one_factors', easy.factorial_plus_one_factors, _constant_key, takes_n=False),
+
+    # normal.py
+    ReportTask('subgroups_of_Sm', normal.subgroups_of_Sm, _n_key),
+    ReportTask('element_powers_in_Sm', normal.element_powers_in_Sm, _n_key),
+    ReportTask('solve_sigma_power_eq', normal.solve_sigma_power_eq, _params_key('m', 'n')),
+    ReportTask('elements_of_order_k_in_cyclic_group',
+               normal.elements_of_order_k_in_cyclic_group, _params_key('m', 'k')),
+    ReportTask('subgroups_of_Zm_star', normal.subgroups_of_Zm_star, _params_key('m')),
+    ReportTask('order_of_sr', normal.order_of_sr, _params_key('p', 's', 'r')),
+    ReportTask('order_and_primitivity_of_t', normal.order_and_primitivity_of_t, _params_key('p', 't')),
+    ReportTask('generators_of_Zm_star', normal.generators_of_Zm_star, _params_key('m')),
+    ReportTask('cyclic_subgroup_in_Zm_additive', normal.cyclic_subgroup_in_Zm_additive, _params_key('m', 't')),
+    ReportTask('isomorphism_of_cyclic_subgroup_Zm_star',
+               normal.isomorphism_of_cyclic_subgroup_Zm_star, _params_key('m', 't')),
+    ReportTask('polynomial_roots', normal.polynomial_roots, _mod_key(4, 7)),
+    ReportTask('polynomial_factorization', normal.polynomial_factorization, _mod_key(5, 9)),
+    ReportTask('polynomial_gcd', normal.polynomial_gcd, _mod_key(11)),
+    ReportTask('polynomial_inverse', normal.polynomial_inverse, _mod_key(11)),
+    ReportTask('generate_irreducible_polynomials', _irreducible_polynomials, _params_key('p_field', 'm_field')),
+)
+
+DEFAULT_TIMEOUT = 60.0
+
+# Запас времени на передачу результата из процесса после срабатывания тайм-аута
+TIMEOUT_GRACE = 1.0
+
+# Задачи, время работы которых сильно зависит от параметров
+TIMEOUTS: Dict[str, float] = {
+    'factorial_plus_one_factors': 120.0,
+    'solve_sigma_power_eq': 30.0,
+}
+
+
+class _Deadline(BaseException):
+    """
+    Срабатывание тайм-аута в рабочем процессе. Наследуется от BaseException,
+    чтобы его не перехватывали блоки except Exception в функциях модулей.
+    """
+
+
+# Интервал повторного SIGALRM, если _Deadline всё же перехватили (голый except)
+_DEADLINE_REPEAT = 0.05
+
+
+def _call_with_deadline(func: Callable, args: tuple, timeout: float) -> Any:
+    """
+    Выполняет func(*args) в рабочем процессе, прерывая его по SIGALRM через
+    timeout секунд, чтобы зависшая задача не занимала процесс пула.
+    По истечении времени выбрасывает TimeoutError.
+    Без SIGALRM (Windows) или вне главного потока ограничение не ставится.
+    """
+    if not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        return func(*args)
+
+    expired = False
+
+    def on_alarm(signum, frame):
+        nonlocal expired
+        expired = True
+        raise _Deadline
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout, _DEADLINE_REPEAT)
+    try:
+        result = func(*args)
+    except _Deadline:
+        result = None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+    if expired:
+        raise TimeoutError(f"Превышено время выполнения ({timeout} с)")
+    return result
+
+
+class ReportService:
+    """
+    Асинхронный фронтенд для построения отчета easy.py + normal.py по N.
+
+    Каждая задача выполняется в пуле процессов (или в переданном executor),
+    не блокируя цикл событий. Одновременные запросы с одинаковым классом
+    параметров разделяют одно вычисление (single-flight). При превышении
+    времени ожидания задача прерывается в рабочем процессе и возвращает
+    словарь с ключом 'error', как и функции модулей.
+
+    В пул одновременно отправляется не больше max_workers задач, поэтому
+    тайм-аут отсчитывается с момента начала работы, а не с постановки в
+    очередь. При передаче своего executor укажите max_workers равным его размеру.
+
+        async with ReportService() as service:
+            async for name, result in service.stream_report(N):
+                ...
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_workers: Optional[int] = None,
+                 timeouts: Optional[Dict[str, float]] = None, default_timeout: float = DEFAULT_TIMEOUT):
+        self._own_executor = executor is None
+        self._executor = executor if executor is not None else ProcessPoolExecutor(max_workers)
+        self._timeouts = {**TIMEOUTS, **(timeouts or {})}
+        self._default_timeout = default_timeout
+        self._slots = asyncio.Semaphore(max_workers or os.cpu_count() or 1)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    async def __aenter__(self) -> 'ReportService':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Останавливает собственный пул процессов"""
+        if self._own_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_job(self, task: ReportTask, args: tuple, timeout: float) -> Any:
+        """
+        Ждет свободный процесс пула и выполняет задачу. Слот освобождается,
+        только когда процесс действительно закончил работу.
+        """
+        await self._slots.acquire()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, _call_with_deadline, task.func, args, timeout)
+
+        def release(f: asyncio.Future) -> None:
+            self._slots.release()
+            if not f.cancelled():
+                f.exception()
+
+        future.add_done_callback(release)
+        # Внешний тайм-аут на случай, если SIGALRM недоступен или не сработал
+        return await asyncio.wait_for(asyncio.shield(future), timeout + TIMEOUT_GRACE)
+
+    def _submit(self, task: ReportTask, N: int, timeout: float) -> asyncio.Future:
+        key = (task.name,) + task.key(N)
+        job = self._inflight.get(key)
+        if job is None:
+            args = (N,) if task.takes_n else ()
+            job = asyncio.ensure_future(self._run_job(task, args, timeout))
+            self._inflight[key] = job
+            job.add_done_callback(lambda f: self._inflight.pop(key, None))
+        return job
+
+    async def run_task(self, task: ReportTask, N: int) -> Any:
+        """Выполняет одну задачу отчета с учетом тайм-аута"""
+        timeout = self._timeouts.get(task.name, self._default_timeout)
+        try:
+            # shield: отмена одного ожидающего не отменяет общее вычисление
+            return await asyncio.shield(self._submit(task, N, timeout))
+        except (asyncio.TimeoutError, TimeoutError):
+            return {'error': f'Превышено время ожидания ({timeout} с)'}
+        except Exception as e:
+            return {'error': f'Ошибка: {e}'}
+
+    async def stream_report(self, N: int) -> AsyncIterator[Tuple[str, Any]]:
+        """Выдает пары (имя задачи, результат) по мере готовности"""
+        async def named(task: ReportTask) -> Tuple[str, Any]:
+            return task.name, await self.run_task(task, N)
+
+        pending = [asyncio.ensure_future(named(task)) for task in TASKS]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def report(self, N: int) -> Dict[str, Any]:
+        """Полный отчет по N в порядке TASKS"""
+        results = {name: result async for name, result in self.stream_report(N)}
+        return {task.name: results[task.name] for task in TASKS}